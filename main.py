@@ -1,39 +1,36 @@
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 
-from src.core.platform.logging import Logger
+from src.adapters.web.middleware.access_log import AccessLogASGI
+from src.adapters.web.middleware.cors_asgi import ASGICors
+from src.adapters.web.middleware.unhandled_error import UnhandledErrorASGI
+from src.core.platform.logging import get_logger
 from src.routes.routes_manager import RoutesManager
 
-logger = Logger("main")
+logger = get_logger("main")
 app = FastAPI(
     title="RocketBot Challenge API",
     description="API for managing tasks - RocketBot Challenge",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
-origins = ["*"]
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Added first so it runs innermost: error responses still get CORS headers
+# and an access log line, and the error never reaches the server's handler
+app.add_middleware(UnhandledErrorASGI)
+app.add_middleware(ASGICors)
+app.add_middleware(AccessLogASGI)
 
 
 @app.get("/", include_in_schema=False)
 async def redirect_to_docs():
     """Redirect root path to API documentation"""
-    logger.info("GET / - Redirecting to API documentation")
     return RedirectResponse(url="/docs")
 
 
 @app.get("/health", include_in_schema=False)
 async def health_check():
     """Health check endpoint"""
-    logger.info("GET /health - Health check requested")
     return {"status": "healthy", "message": "RocketBot Challenge API is running"}
 
 
@@ -44,7 +41,19 @@ logger.info("Routes initialized successfully")
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
     logger.info("Starting RocketBot Challenge API server...")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Tasks live in memory, so each worker process keeps its own independent
+    # store; raise API_WORKERS only once a shared backend is in place.
+    uvicorn.run(
+        "main:app",
+        host=os.getenv("API_HOST", "0.0.0.0"),
+        port=int(os.getenv("API_PORT", "8000")),
+        workers=int(os.getenv("API_WORKERS", "1")),
+        loop="auto",
+        http="httptools",
+        access_log=False,
+    )
@@ -35,7 +35,7 @@ class TestInMemoryTaskRepositoryBasic(unittest.TestCase):
     def test_find_all_empty(self):
         """Test find_all on empty repository"""
         tasks = self.repository.find_all()
-        self.assertEqual(tasks, [])
+        self.assertEqual(tasks, ())
 
     def test_find_all_with_tasks(self):
         """Test find_all with tasks"""
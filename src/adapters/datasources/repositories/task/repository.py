@@ -1,55 +1,62 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from src.adapters.datasources.repositories.task.repository_interface import (
-    TaskRepositoryInterface,
-)
 from src.core.domain.model import Task
 
 
-class InMemoryTaskRepository(TaskRepositoryInterface):
+class InMemoryTaskRepository:
     """In-memory implementation of Task repository"""
 
-    def __init__(self):
-        self._tasks: List[Task] = []
+    def __init__(self, clock: Callable[[], datetime] = datetime.now):
+        self._tasks: Dict[int, Task] = {}
         self._next_id = 1
+        self._clock = clock
 
     def create(self, task: Task) -> Task:
         """Create a new task"""
         task.id = self._next_id
-        now = datetime.now()
+        now = self._clock()
         task.created_at = now
         task.updated_at = now
-        self._tasks.append(task)
+        self._tasks[self._next_id] = task
         self._next_id += 1
         return task
 
-    def find_all(self) -> List[Task]:
-        """Find all tasks"""
-        return self._tasks.copy()
+    def create_many(self, tasks: Iterable[Task]) -> List[Task]:
+        """Create several tasks sharing a single timestamp"""
+        now = self._clock()
+        created_tasks = list(tasks)
+        task_ids = range(self._next_id, self._next_id + len(created_tasks))
+        for task_id, task in zip(task_ids, created_tasks):
+            task.id = task_id
+            task.created_at = now
+            task.updated_at = now
+        self._tasks.update(zip(task_ids, created_tasks))
+        self._next_id += len(created_tasks)
+        return created_tasks
+
+    def find_all(self) -> Tuple[Task, ...]:
+        """Find all tasks as a shallow tuple of the live task objects"""
+        return tuple(self._tasks.values())
+
+    def iter_all(self) -> Iterator[Task]:
+        """Iterate over all tasks without copying"""
+        return iter(self._tasks.values())
 
     def find_by_id(self, task_id: int) -> Optional[Task]:
         """Find task by id"""
-        for task in self._tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._tasks.get(task_id)
 
     def update(self, task_id: int, task: Task) -> Optional[Task]:
-        """Update task by id"""
-        for i, existing_task in enumerate(self._tasks):
-            if existing_task.id == task_id:
-                task.id = task_id
-                task.created_at = existing_task.created_at
-                task.updated_at = datetime.now()
-                self._tasks[i] = task
-                return task
-        return None
+        """Update the stored task in place by id"""
+        existing_task = self._tasks.get(task_id)
+        if existing_task is None:
+            return None
+        existing_task.title = task.title
+        existing_task.category = task.category
+        existing_task.updated_at = self._clock()
+        return existing_task
 
     def delete(self, task_id: int) -> bool:
         """Delete task by id"""
-        for i, task in enumerate(self._tasks):
-            if task.id == task_id:
-                del self._tasks[i]
-                return True
-        return False
+        return self._tasks.pop(task_id, None) is not None
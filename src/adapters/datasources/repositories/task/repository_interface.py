@@ -1,33 +1,44 @@
-from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    runtime_checkable,
+)
 
 from src.core.domain.model import Task
 
 
-class TaskRepositoryInterface(ABC):
+@runtime_checkable
+class TaskRepositoryInterface(Protocol):
     """Interface for Task repository"""
 
-    @abstractmethod
     def create(self, task: Task) -> Task:
         """Create a new task"""
-        pass
+        ...
 
-    @abstractmethod
-    def find_all(self) -> List[Task]:
-        """Find all tasks"""
-        pass
+    def create_many(self, tasks: Iterable[Task]) -> List[Task]:
+        """Create several tasks at once"""
+        ...
+
+    def find_all(self) -> Tuple[Task, ...]:
+        """Find all tasks as a shallow tuple of the live task objects"""
+        ...
+
+    def iter_all(self) -> Iterator[Task]:
+        """Iterate over all tasks without copying"""
+        ...
 
-    @abstractmethod
     def find_by_id(self, task_id: int) -> Optional[Task]:
         """Find task by id"""
-        pass
+        ...
 
-    @abstractmethod
     def update(self, task_id: int, task: Task) -> Optional[Task]:
         """Update task by id"""
-        pass
+        ...
 
-    @abstractmethod
     def delete(self, task_id: int) -> bool:
         """Delete task by id"""
-        pass
+        ...
@@ -1,88 +1,77 @@
 from typing import List, Optional
 
-from src.core.platform.logging import Logger
+from src.core.platform.logging import Logger, get_logger
 from src.core.use_cases.use_cases import Usecases
 from src.schemas.schemas import DeleteTaskResponse, TaskInput, TaskOutput
 
+_DELETED_MESSAGE = "Task {} eliminada correctamente"
+_NOT_FOUND_MESSAGE = "Task {} no encontrada"
+
 
 class TaskService:
     """Service for task operations"""
 
     def __init__(self, usecases: Usecases, logger: Optional[Logger] = None):
         self.usecases = usecases
-        self.logger = logger or Logger("task_service")
+        self.logger = logger or get_logger("task_service")
+        task_usecases = usecases.task
+        self._create = task_usecases.create_usecase.execute
+        self._iter_all = task_usecases.get_all_usecase.iter_execute
+        self._get_by_id = task_usecases.get_by_id_usecase.execute
+        self._update = task_usecases.update_usecase.execute
+        self._delete = task_usecases.delete_usecase.execute
 
     async def create_task(self, task_input: TaskInput) -> TaskOutput:
         """Create a new task"""
-        try:
-            self.logger.info(f"Creating task: {task_input.title}")
-            task = self.usecases.task.create_usecase.execute(
-                title=task_input.title, category=task_input.category
-            )
-            self.logger.info(f"Task created successfully with ID: {task.id}")
-            return TaskOutput.from_task(task)
-        except Exception as e:
-            self.logger.log_exception("Error creating task", e)
-            raise
+        self.logger.info("Creating task: %s", task_input.title)
+        task = self._create(title=task_input.title, category=task_input.category)
+        self.logger.info("Task created successfully with ID: %s", task.id)
+        return TaskOutput.from_task(task)
 
     async def get_all_tasks(self) -> List[TaskOutput]:
         """Get all tasks"""
-        try:
-            self.logger.info("Retrieving all tasks")
-            tasks = self.usecases.task.get_all_usecase.execute()
-            self.logger.info(f"Retrieved {len(tasks)} tasks")
-            return [TaskOutput.from_task(task) for task in tasks]
-        except Exception as e:
-            self.logger.log_exception("Error retrieving all tasks", e)
-            raise
+        self.logger.info("Retrieving all tasks")
+        tasks = TaskOutput.from_tasks(self._iter_all())
+        self.logger.info("Retrieved %s tasks", len(tasks))
+        return tasks
 
     async def get_task_by_id(self, task_id: int) -> Optional[TaskOutput]:
         """Get task by id"""
-        try:
-            self.logger.info(f"Retrieving task with ID: {task_id}")
-            task = self.usecases.task.get_by_id_usecase.execute(task_id)
-            if task:
-                self.logger.info(f"Task found: {task.title}")
-                return TaskOutput.from_task(task)
-            else:
-                self.logger.warning(f"Task not found with ID: {task_id}")
-                return None
-        except Exception as e:
-            self.logger.log_exception(f"Error retrieving task with ID: {task_id}", e)
-            raise
+        self.logger.info("Retrieving task with ID: %s", task_id)
+        task = self._get_by_id(task_id)
+        if task:
+            self.logger.info("Task found: %s", task.title)
+            return TaskOutput.from_task(task)
+        else:
+            self.logger.warning("Task not found with ID: %s", task_id)
+            return None
 
     async def update_task(
         self, task_id: int, task_input: TaskInput
     ) -> Optional[TaskOutput]:
         """Update a task"""
-        try:
-            self.logger.info(f"Updating task with ID: {task_id}")
-            task = self.usecases.task.update_usecase.execute(
-                task_id=task_id, title=task_input.title, category=task_input.category
-            )
-            if task:
-                self.logger.info(f"Task updated successfully: {task.title}")
-                return TaskOutput.from_task(task)
-            else:
-                self.logger.warning(f"Task not found for update with ID: {task_id}")
-                return None
-        except Exception as e:
-            self.logger.log_exception(f"Error updating task with ID: {task_id}", e)
-            raise
+        self.logger.info("Updating task with ID: %s", task_id)
+        task = self._update(
+            task_id=task_id, title=task_input.title, category=task_input.category
+        )
+        if task:
+            self.logger.info("Task updated successfully: %s", task.title)
+            return TaskOutput.from_task(task)
+        else:
+            self.logger.warning("Task not found for update with ID: %s", task_id)
+            return None
 
     async def delete_task(self, task_id: int) -> DeleteTaskResponse:
         """Delete a task"""
-        try:
-            self.logger.info(f"Deleting task with ID: {task_id}")
-            success = self.usecases.task.delete_usecase.execute(task_id)
-            if success:
-                self.logger.info(f"Task deleted successfully with ID: {task_id}")
-                return DeleteTaskResponse(
-                    message=f"Task {task_id} eliminada correctamente"
-                )
-            else:
-                self.logger.warning(f"Task not found for deletion with ID: {task_id}")
-                return DeleteTaskResponse(message=f"Task {task_id} no encontrada")
-        except Exception as e:
-            self.logger.log_exception(f"Error deleting task with ID: {task_id}", e)
-            raise
+        self.logger.info("Deleting task with ID: %s", task_id)
+        success = self._delete(task_id)
+        if success:
+            self.logger.info("Task deleted successfully with ID: %s", task_id)
+            return DeleteTaskResponse.model_construct(
+                message=_DELETED_MESSAGE.format(task_id)
+            )
+        else:
+            self.logger.warning("Task not found for deletion with ID: %s", task_id)
+            return DeleteTaskResponse.model_construct(
+                message=_NOT_FOUND_MESSAGE.format(task_id)
+            )
@@ -1,9 +1,10 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 
 from src.adapters.services.task.task_service import TaskService
-from src.core.platform.logging import Logger
+from src.core.platform.logging import get_logger
 from src.schemas.schemas import DeleteTaskResponse, TaskInput, TaskOutput
 
 router = APIRouter(
@@ -11,10 +12,12 @@ router = APIRouter(
     tags=["tasks"],
 )
 
-logger = Logger("task_controller")
+logger = get_logger("task_controller")
 
+_TASK_LIST_ADAPTER = TypeAdapter(List[TaskOutput])
 
-def get_task_service() -> TaskService:
+
+async def get_task_service() -> TaskService:
     """Dependency to get task service instance"""
     logger.error("Service not configured - dependency injection failed")
     raise HTTPException(
@@ -26,17 +29,10 @@ def get_task_service() -> TaskService:
 @router.get("/", response_model=List[TaskOutput], status_code=status.HTTP_200_OK)
 async def get_all_tasks(service: TaskService = Depends(get_task_service)):
     """Get all tasks"""
-    try:
-        logger.info("GET /tasks - Retrieving all tasks")
-        tasks = await service.get_all_tasks()
-        logger.info(f"GET /tasks - Successfully retrieved {len(tasks)} tasks")
-        return tasks
-    except Exception as e:
-        logger.log_exception("GET /tasks - Error retrieving tasks", e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+    tasks = await service.get_all_tasks()
+    return Response(
+        content=_TASK_LIST_ADAPTER.dump_json(tasks), media_type="application/json"
+    )
 
 
 @router.post("/", response_model=TaskOutput, status_code=status.HTTP_201_CREATED)
@@ -44,17 +40,7 @@ async def create_task(
     task_input: TaskInput, service: TaskService = Depends(get_task_service)
 ):
     """Create a new task"""
-    try:
-        logger.info(f"POST /tasks - Creating task: {task_input.title}")
-        task = await service.create_task(task_input)
-        logger.info(f"POST /tasks - Task created successfully with ID: {task.id}")
-        return task
-    except Exception as e:
-        logger.log_exception("POST /tasks - Error creating task", e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+    return await service.create_task(task_input)
 
 
 @router.get("/{task_id}", response_model=TaskOutput, status_code=status.HTTP_200_OK)
@@ -62,25 +48,12 @@ async def get_task_by_id(
     task_id: int, service: TaskService = Depends(get_task_service)
 ):
     """Get task by id"""
-    try:
-        logger.info(f"GET /tasks/{task_id} - Retrieving task")
-        task = await service.get_task_by_id(task_id)
-        if not task:
-            logger.warning(f"GET /tasks/{task_id} - Task not found")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
-            )
-
-        logger.info(f"GET /tasks/{task_id} - Task found: {task.title}")
-        return task
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.log_exception(f"GET /tasks/{task_id} - Error retrieving task", e)
+    task = await service.get_task_by_id(task_id)
+    if not task:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
+            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
         )
+    return task
 
 
 @router.put("/{task_id}", response_model=TaskOutput, status_code=status.HTTP_200_OK)
@@ -90,25 +63,12 @@ async def update_task(
     service: TaskService = Depends(get_task_service),
 ):
     """Update a task"""
-    try:
-        logger.info(f"PUT /tasks/{task_id} - Updating task")
-        task = await service.update_task(task_id, task_input)
-        if not task:
-            logger.warning(f"PUT /tasks/{task_id} - Task not found for update")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
-            )
-
-        logger.info(f"PUT /tasks/{task_id} - Task updated successfully: {task.title}")
-        return task
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.log_exception(f"PUT /tasks/{task_id} - Error updating task", e)
+    task = await service.update_task(task_id, task_input)
+    if not task:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
+            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
         )
+    return task
 
 
 @router.delete(
@@ -116,14 +76,4 @@ async def update_task(
 )
 async def delete_task(task_id: int, service: TaskService = Depends(get_task_service)):
     """Delete a task"""
-    try:
-        logger.info(f"DELETE /tasks/{task_id} - Deleting task")
-        result = await service.delete_task(task_id)
-        logger.info(f"DELETE /tasks/{task_id} - Task deletion completed")
-        return result
-    except Exception as e:
-        logger.log_exception(f"DELETE /tasks/{task_id} - Error deleting task", e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+    return await service.delete_task(task_id)
@@ -0,0 +1,15 @@
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+
+from src.core.platform.logging import get_logger
+
+logger = get_logger("exception_handlers")
+
+
+async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Log an unexpected error once and return a generic 500 response"""
+    logger.log_exception(f"{request.method} {request.url.path}", exc)
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Internal server error"},
+    )
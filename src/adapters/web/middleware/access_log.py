@@ -0,0 +1,39 @@
+import time
+from typing import List, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.platform.logging import Logger, get_logger
+
+
+class AccessLogASGI:
+    """Pure ASGI middleware that logs one line per HTTP request"""
+
+    def __init__(self, app: ASGIApp, logger: Optional[Logger] = None):
+        self.app = app
+        self.logger = logger or get_logger("access")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Log method, path, status and latency once the request completes"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_holder: List[int] = [500]
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status_holder[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.logger.info(
+                "%s %s %d %.3fms",
+                scope["method"],
+                scope["path"],
+                status_holder[0],
+                (time.perf_counter() - start) * 1000,
+            )
@@ -0,0 +1,73 @@
+from typing import Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Headers = Tuple[Tuple[bytes, bytes], ...]
+
+
+class ASGICors:
+    """Pure ASGI CORS middleware with precomputed response headers"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origin: bytes = b"*",
+        allow_methods: bytes = b"GET,POST,PUT,DELETE,OPTIONS,PATCH",
+        allow_headers: bytes = b"*",
+        max_age: bytes = b"600",
+    ):
+        self.app = app
+        self._echo_request_headers = allow_headers == b"*"
+        self._headers: Headers = ((b"access-control-allow-origin", allow_origin),)
+        self._preflight_headers: Headers = (
+            *self._headers,
+            (b"access-control-allow-methods", allow_methods),
+            (b"access-control-allow-headers", allow_headers),
+            (b"access-control-max-age", max_age),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Inject CORS headers and answer preflight requests directly"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            request_headers = dict(scope["headers"])
+            if self._is_preflight(request_headers):
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 204,
+                        "headers": self._build_preflight_headers(request_headers),
+                    }
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        cors_headers = self._headers
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _build_preflight_headers(self, request_headers: dict) -> list:
+        """Echo the requested headers back when every header is allowed"""
+        requested = request_headers.get(b"access-control-request-headers")
+        if not (self._echo_request_headers and requested):
+            return list(self._preflight_headers)
+        return [
+            (name, requested if name == b"access-control-allow-headers" else value)
+            for name, value in self._preflight_headers
+        ]
+
+    @staticmethod
+    def _is_preflight(request_headers: dict) -> bool:
+        """Check for the Origin and Access-Control-Request-Method headers"""
+        return (
+            b"origin" in request_headers
+            and b"access-control-request-method" in request_headers
+        )
@@ -0,0 +1,42 @@
+from typing import Awaitable, Callable
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.adapters.web.exception_handlers import unhandled_exception_handler
+
+ExceptionHandler = Callable[[Request, Exception], Awaitable[Response]]
+
+
+class UnhandledErrorASGI:
+    """Pure ASGI middleware that turns unexpected errors into a 500 response"""
+
+    def __init__(
+        self, app: ASGIApp, handler: ExceptionHandler = unhandled_exception_handler
+    ):
+        self.app = app
+        self.handler = handler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send the handler's response without re-raising to the server"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            # A partially sent response cannot be replaced; let the server abort it
+            if response_started:
+                raise
+            response = await self.handler(Request(scope), exc)
+            await response(scope, receive, send)
@@ -1,17 +1,14 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
 
-
-class Task(BaseModel):
+@dataclass(slots=True)
+class Task:
     """Domain model for Task"""
 
-    id: Optional[int] = Field(default=None)
     title: str
     category: str
-    created_at: Optional[datetime] = Field(default=None)
-    updated_at: Optional[datetime] = Field(default=None)
-
-    class Config:
-        populate_by_name = True
+    id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
@@ -2,7 +2,7 @@ from typing import Callable, Optional
 
 from src.adapters.datasources.datasources import Datasources
 from src.adapters.datasources.repositories.repositories import Repositories
-from src.core.platform.logging import Logger
+from src.core.platform.logging import Logger, get_logger
 
 
 class Context:
@@ -14,7 +14,7 @@ class Context:
         logger: Optional[Logger] = None,
     ):
         self.repositories = repositories
-        self.logger = logger or Logger("appcontext")
+        self.logger = logger or get_logger("appcontext")
 
 
 Option = Callable[[Context], None]
@@ -29,7 +29,7 @@ def new_factory(
     def factory(*opts: Option) -> Context:
         context = Context(
             repositories=Repositories.create_repositories(datasources),
-            logger=Logger("appcontext"),
+            logger=get_logger("appcontext"),
         )
         for opt in opts:
             opt(context)
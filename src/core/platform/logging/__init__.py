@@ -1,3 +1,3 @@
-from .logger import Logger, LoggerFactory, get_logger
+from .logger import CachedTimeFormatter, Logger, LoggerFactory, get_logger
 
-__all__ = ["Logger", "LoggerFactory", "get_logger"]
+__all__ = ["CachedTimeFormatter", "Logger", "LoggerFactory", "get_logger"]
@@ -1,6 +1,50 @@
 import logging
 import sys
 
+_configured = False
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the timestamp once per wall-clock second"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time: tuple[int, str | None, str] = (-1, None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt=None) -> str:
+        """Reuse the formatted time for records within the same second
+
+        Without a datefmt the stdlib appends milliseconds, so those records
+        are formatted every time.
+        """
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_time = self._cached_time
+        if cached_time[0] != second or cached_time[1] != datefmt:
+            cached_time = (second, datefmt, super().formatTime(record, datefmt))
+            self._cached_time = cached_time
+        return cached_time[2]
+
+
+def _setup_handler():
+    """Attach the console handler to the root logger once per process
+
+    The handler lives on the root logger on purpose, so third-party loggers
+    such as uvicorn and httpx share the application's console format.
+    """
+    global _configured
+    if _configured:
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    formatter = CachedTimeFormatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    handler.setFormatter(formatter)
+    logging.getLogger().addHandler(handler)
+    _configured = True
+
 
 class Logger:
     """Logger wrapper for the application"""
@@ -8,39 +52,32 @@ class Logger:
     def __init__(self, name: str, level: int = logging.INFO):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
+        _setup_handler()
 
-        if not self.logger.handlers:
-            self._setup_handler()
-
-    def _setup_handler(self):
-        """Setup console handler with custom format"""
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
-
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args, **kwargs):
         """Log debug message"""
-        self.logger.debug(message, extra=kwargs)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(message, *args, extra=kwargs)
 
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """Log info message"""
-        self.logger.info(message, extra=kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(message, *args, extra=kwargs)
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message"""
-        self.logger.warning(message, extra=kwargs)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(message, *args, extra=kwargs)
 
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """Log error message"""
-        self.logger.error(message, extra=kwargs)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(message, *args, extra=kwargs)
 
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args, **kwargs):
         """Log critical message"""
-        self.logger.critical(message, extra=kwargs)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger.critical(message, *args, extra=kwargs)
 
     def log_exception(self, message: str, exception: Exception, **kwargs):
         """Log exception with traceback"""
@@ -1,21 +1,32 @@
-from typing import List, Optional
+from typing import Iterator, Optional, Tuple
 
+from src.adapters.datasources.repositories.task.repository_interface import (
+    TaskRepositoryInterface,
+)
 from src.core.domain.model import Task
 from src.core.platform.appcontext.appcontext import Context
 
 
+def _task_repository(context: Context) -> Optional[TaskRepositoryInterface]:
+    """Resolve the task repository once so use cases skip the attribute chain"""
+    if context.repositories is None:
+        return None
+    return context.repositories.task
+
+
 class CreateTaskUseCase:
     """Use case for creating a new task"""
 
     def __init__(self, context: Context):
         self.context = context
+        self._repo = _task_repository(context)
 
     def execute(self, title: str, category: str) -> Task:
         """Create a new task"""
-        if self.context.repositories is None:
+        if self._repo is None:
             raise ValueError("Repositories not initialized")
         task = Task(title=title, category=category)
-        return self.context.repositories.task.create(task)
+        return self._repo.create(task)
 
 
 class GetAllTasksUseCase:
@@ -23,12 +34,19 @@ class GetAllTasksUseCase:
 
     def __init__(self, context: Context):
         self.context = context
+        self._repo = _task_repository(context)
 
-    def execute(self) -> List[Task]:
+    def execute(self) -> Tuple[Task, ...]:
         """Get all tasks"""
-        if self.context.repositories is None:
+        if self._repo is None:
+            raise ValueError("Repositories not initialized")
+        return self._repo.find_all()
+
+    def iter_execute(self) -> Iterator[Task]:
+        """Iterate over all tasks without copying"""
+        if self._repo is None:
             raise ValueError("Repositories not initialized")
-        return self.context.repositories.task.find_all()
+        return self._repo.iter_all()
 
 
 class GetTaskByIdUseCase:
@@ -36,12 +54,13 @@ class GetTaskByIdUseCase:
 
     def __init__(self, context: Context):
         self.context = context
+        self._repo = _task_repository(context)
 
     def execute(self, task_id: int) -> Optional[Task]:
         """Get task by id"""
-        if self.context.repositories is None:
+        if self._repo is None:
             raise ValueError("Repositories not initialized")
-        return self.context.repositories.task.find_by_id(task_id)
+        return self._repo.find_by_id(task_id)
 
 
 class UpdateTaskUseCase:
@@ -49,13 +68,14 @@ class UpdateTaskUseCase:
 
     def __init__(self, context: Context):
         self.context = context
+        self._repo = _task_repository(context)
 
     def execute(self, task_id: int, title: str, category: str) -> Optional[Task]:
         """Update a task"""
-        if self.context.repositories is None:
+        if self._repo is None:
             raise ValueError("Repositories not initialized")
         task = Task(title=title, category=category)
-        return self.context.repositories.task.update(task_id, task)
+        return self._repo.update(task_id, task)
 
 
 class DeleteTaskUseCase:
@@ -63,9 +83,10 @@ class DeleteTaskUseCase:
 
     def __init__(self, context: Context):
         self.context = context
+        self._repo = _task_repository(context)
 
     def execute(self, task_id: int) -> bool:
         """Delete a task"""
-        if self.context.repositories is None:
+        if self._repo is None:
             raise ValueError("Repositories not initialized")
-        return self.context.repositories.task.delete(task_id)
+        return self._repo.delete(task_id)
@@ -1,4 +1,7 @@
+import inspect
+
 from fastapi import FastAPI
+from starlette.routing import Route
 
 from src.adapters.datasources.datasources import Datasources
 from src.adapters.services.task.task_service import TaskService
@@ -13,15 +16,38 @@ class RoutesManager:
 
     def __init__(self, app: FastAPI):
         self.app = app
+        self.task_service = self._create_task_service()
 
-    def include_routes(self):
-        """Include all routes in the FastAPI app"""
+    @staticmethod
+    def _create_task_service() -> TaskService:
+        """Wire datasources, use cases and the task service once"""
         datasources = Datasources.create_datasources()
         context_factory = new_factory(datasources)
         usecases = create_usecases(context_factory)
-        task_service = TaskService(usecases)
+        return TaskService(usecases)
 
-        # Override the dependency function to return our configured service
-        self.app.dependency_overrides[get_task_service] = lambda: task_service
+    async def _provide_task_service(self) -> TaskService:
+        """Dependency provider returning the shared task service"""
+        return self.task_service
+
+    def include_routes(self):
+        """Include all routes in the FastAPI app"""
+        # Override the dependency with a coroutine so FastAPI resolves it on the
+        # event loop instead of dispatching it to the threadpool
+        self.app.dependency_overrides[get_task_service] = self._provide_task_service
 
         self.app.include_router(task_router)
+        self._ensure_async_endpoints()
+
+    def _ensure_async_endpoints(self):
+        """Fail fast if any endpoint would be dispatched to the threadpool"""
+        sync_endpoints = [
+            route.path
+            for route in self.app.routes
+            if isinstance(route, Route)
+            and not inspect.iscoroutinefunction(route.endpoint)
+        ]
+        if sync_endpoints:
+            raise RuntimeError(
+                f"Endpoints must be declared with async def: {sync_endpoints}"
+            )
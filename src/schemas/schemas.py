@@ -1,6 +1,9 @@
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+_to_iso = datetime.isoformat
 
 
 class TaskInput(BaseModel):
@@ -13,6 +16,8 @@ class TaskInput(BaseModel):
 class TaskOutput(BaseModel):
     """Output schema for task responses"""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     title: str
     category: str
@@ -21,15 +26,23 @@ class TaskOutput(BaseModel):
 
     @classmethod
     def from_task(cls, task) -> "TaskOutput":
-        """Create TaskOutput from Task domain model"""
-        return cls(
+        """Create TaskOutput from Task domain model without re-validation"""
+        created_at = task.created_at
+        updated_at = task.updated_at
+        return cls.model_construct(
             id=task.id,
             title=task.title,
             category=task.category,
-            created_at=task.created_at.isoformat() if task.created_at else None,
-            updated_at=task.updated_at.isoformat() if task.updated_at else None,
+            created_at=_to_iso(created_at) if created_at is not None else None,
+            updated_at=_to_iso(updated_at) if updated_at is not None else None,
         )
 
+    @classmethod
+    def from_tasks(cls, tasks: Iterable) -> List["TaskOutput"]:
+        """Create TaskOutput list from Task domain models in a single pass"""
+        from_task = cls.from_task
+        return [from_task(task) for task in tasks]
+
 
 class DeleteTaskResponse(BaseModel):
     """Response schema for task deletion"""
@@ -2,13 +2,44 @@
 Test fixtures and configuration for the test suite.
 """
 
-from datetime import datetime
-from typing import List
+import asyncio
+import itertools
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Tuple
+from unittest.mock import Mock, create_autospec
 
 import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
 
+from src.adapters.datasources.repositories.repositories import Repositories
 from src.adapters.datasources.repositories.task.repository import InMemoryTaskRepository
+from src.adapters.services.task.task_service import TaskService
+from src.adapters.web.controllers.task.task_controller import get_task_service, router
 from src.core.domain.model import Task
+from src.core.platform.appcontext.appcontext import Context
+from src.core.use_cases import use_cases
+from src.core.use_cases.task_use_cases import (
+    CreateTaskUseCase,
+    DeleteTaskUseCase,
+    GetAllTasksUseCase,
+    GetTaskByIdUseCase,
+    UpdateTaskUseCase,
+)
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on some platforms
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Fixture that runs every async test on one shared event loop"""
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    yield loop
+    loop.close()
 
 
 @pytest.fixture
@@ -38,24 +69,147 @@ def sample_tasks():
 def repository_with_tasks(empty_repository, sample_tasks):
     """Fixture that provides a repository pre-populated with sample tasks"""
     repository = empty_repository
-    created_tasks = []
-
-    for task in sample_tasks:
-        created_task = repository.create(task)
-        created_tasks.append(created_task)
+    created_tasks = repository.create_many(sample_tasks)
 
     return repository, created_tasks
 
 
+LARGE_REPOSITORY_SIZE = 10000
+
+
+@pytest.fixture(scope="module")
+def large_repository():
+    """Fixture that provides a read-only repository with many tasks per module"""
+    repository = InMemoryTaskRepository()
+    repository.create_many(
+        Task(title=f"Task {i}", category="Performance Test")
+        for i in range(LARGE_REPOSITORY_SIZE)
+    )
+    return repository
+
+
 @pytest.fixture
 def task_data():
     """Fixture that provides task data for creation"""
     return {"title": "Test Task", "category": "Testing"}
 
 
+def _autospec(cls):
+    """Helper that builds an instance mock rejecting unknown attributes"""
+    return create_autospec(cls, instance=True, spec_set=True)
+
+
+class FakeTaskRepository:
+    """Hand-rolled task repository stub that records calls and returns canned values"""
+
+    __slots__ = ("calls", "return_values")
+
+    def __init__(self):
+        self.calls: List[Tuple[str, tuple]] = []
+        self.return_values: Dict[str, Any] = {}
+
+    def _record(self, name: str, *args):
+        self.calls.append((name, args))
+        return self.return_values.get(name)
+
+    def called(self, name: str) -> List[tuple]:
+        """Return the positional arguments of every call to the given method"""
+        return [args for call_name, args in self.calls if call_name == name]
+
+    def create(self, task):
+        return self._record("create", task)
+
+    def create_many(self, tasks):
+        return self._record("create_many", tasks)
+
+    def find_all(self):
+        return self._record("find_all")
+
+    def iter_all(self):
+        return self._record("iter_all")
+
+    def find_by_id(self, task_id):
+        return self._record("find_by_id", task_id)
+
+    def update(self, task_id, task):
+        return self._record("update", task_id, task)
+
+    def delete(self, task_id):
+        return self._record("delete", task_id)
+
+
+@pytest.fixture
+def fake_repository():
+    """Fixture that provides a fresh FakeTaskRepository for each test"""
+    return FakeTaskRepository()
+
+
+@pytest.fixture
+def task_context(fake_repository):
+    """Fixture that provides a Context wired to the fake task repository"""
+    return Context(repositories=Repositories(task=fake_repository))
+
+
+@pytest.fixture(scope="class")
+def task_service_mocks():
+    """Fixture that wires use case mocks into one TaskService per test class"""
+    usecase_mocks = {
+        "create_usecase": _autospec(CreateTaskUseCase),
+        "get_all_usecase": _autospec(GetAllTasksUseCase),
+        "get_by_id_usecase": _autospec(GetTaskByIdUseCase),
+        "update_usecase": _autospec(UpdateTaskUseCase),
+        "delete_usecase": _autospec(DeleteTaskUseCase),
+    }
+
+    task_usecases = Mock(spec=use_cases.Task)
+    for name, usecase_mock in usecase_mocks.items():
+        setattr(task_usecases, name, usecase_mock)
+
+    usecases = Mock(spec=use_cases.Usecases)
+    usecases.task = task_usecases
+
+    def reset_all():
+        for usecase_mock in usecase_mocks.values():
+            usecase_mock.reset_mock(return_value=True, side_effect=True)
+
+    return SimpleNamespace(
+        service=TaskService(usecases), reset_all=reset_all, **usecase_mocks
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_task_service():
+    """Fixture that provides a TaskService mock with async methods per session"""
+    return _autospec(TaskService)
+
+
+@pytest.fixture
+def mock_service(mock_task_service):
+    """Fixture that provides the shared TaskService mock reset for each test"""
+    mock_task_service.reset_mock(return_value=True, side_effect=True)
+    return mock_task_service
+
+
+@pytest.fixture(scope="session")
+async def client(mock_task_service):
+    """Fixture that provides an async client for the task router per session"""
+
+    async def provide_task_service():
+        return mock_task_service
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_task_service] = provide_task_service
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+
 class TaskBuilder:
     """Builder pattern for creating test tasks with various configurations"""
 
+    __slots__ = ("title", "category")
+
     def __init__(self):
         self.title = "Default Task"
         self.category = "Default Category"
@@ -78,6 +232,12 @@ def task_builder():
     return TaskBuilder
 
 
+def fake_clock(start: datetime = datetime(2024, 1, 1)) -> Callable[[], datetime]:
+    """Helper returning a clock that advances one second on every call"""
+    ticks = itertools.count()
+    return lambda: start + timedelta(seconds=next(ticks))
+
+
 def assert_task_equality(task1: Task, task2: Task, ignore_timestamps: bool = False):
     """Helper function to assert task equality with optional timestamp ignoring"""
     assert task1.id == task2.id
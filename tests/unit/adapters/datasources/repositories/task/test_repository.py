@@ -5,16 +5,15 @@ This module contains comprehensive unit tests for the InMemoryTaskRepository cla
 testing all CRUD operations and edge cases.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional
 
-import pytest
-
 from src.adapters.datasources.repositories.task.repository import InMemoryTaskRepository
 from src.adapters.datasources.repositories.task.repository_interface import (
     TaskRepositoryInterface,
 )
 from src.core.domain.model import Task
+from tests.conftest import fake_clock
 
 
 class TestInMemoryTaskRepository:
@@ -28,9 +27,33 @@ class TestInMemoryTaskRepository:
         """Test that InMemoryTaskRepository implements TaskRepositoryInterface"""
         assert isinstance(self.repository, TaskRepositoryInterface)
 
+    def test_repository_interface_requires_all_operations(self):
+        """Test that an object missing an operation does not satisfy the interface"""
+
+        class IncompleteRepository:
+            def create(self, task):
+                return task
+
+            def create_many(self, tasks):
+                return list(tasks)
+
+            def find_all(self):
+                return []
+
+            def iter_all(self):
+                return iter(())
+
+            def find_by_id(self, task_id):
+                return None
+
+            def update(self, task_id, task):
+                return None
+
+        assert not isinstance(IncompleteRepository(), TaskRepositoryInterface)
+
     def test_initial_state(self):
         """Test repository initial state"""
-        assert self.repository._tasks == []
+        assert self.repository._tasks == {}
         assert self.repository._next_id == 1
 
     def test_create_task_success(self):
@@ -48,7 +71,7 @@ class TestInMemoryTaskRepository:
         assert isinstance(created_task.updated_at, datetime)
 
         assert len(self.repository._tasks) == 1
-        assert self.repository._tasks[0] == created_task
+        assert self.repository._tasks[1] == created_task
 
     def test_create_multiple_tasks_increments_id(self):
         """Test that creating multiple tasks increments ID correctly"""
@@ -66,12 +89,40 @@ class TestInMemoryTaskRepository:
         assert self.repository._next_id == 4
         assert len(self.repository._tasks) == 3
 
+    def test_create_many_assigns_ids_and_shared_timestamp(self):
+        """Test that create_many assigns sequential IDs and one timestamp"""
+        tasks = [
+            Task(title="Task 1", category="Category 1"),
+            Task(title="Task 2", category="Category 2"),
+            Task(title="Task 3", category="Category 3"),
+        ]
+
+        created_tasks = self.repository.create_many(tasks)
+
+        assert [task.id for task in created_tasks] == [1, 2, 3]
+        assert self.repository._next_id == 4
+        assert len(self.repository._tasks) == 3
+        timestamps = {task.created_at for task in created_tasks}
+        assert len(timestamps) == 1
+        assert all(task.updated_at == task.created_at for task in created_tasks)
+
+    def test_create_many_continues_existing_ids(self):
+        """Test that create_many continues from the current ID counter"""
+        self.repository.create(Task(title="Existing", category="Existing"))
+
+        created_tasks = self.repository.create_many(
+            [Task(title="Task 2", category="Category 2")]
+        )
+
+        assert created_tasks[0].id == 2
+        assert self.repository.find_by_id(2) is created_tasks[0]
+
     def test_find_all_empty_repository(self):
-        """Test find_all returns empty list when repository is empty"""
+        """Test find_all returns an empty tuple when repository is empty"""
         tasks = self.repository.find_all()
 
-        assert tasks == []
-        assert isinstance(tasks, list)
+        assert tasks == ()
+        assert isinstance(tasks, tuple)
 
     def test_find_all_with_tasks(self):
         """Test find_all returns all tasks"""
@@ -88,15 +139,25 @@ class TestInMemoryTaskRepository:
         assert created_task2 in tasks
 
     def test_find_all_returns_copy(self):
-        """Test that find_all returns a copy, not the original list"""
+        """Test that find_all returns a tuple unaffected by later creates"""
         task = Task(title="Test Task", category="Testing")
         self.repository.create(task)
 
         tasks = self.repository.find_all()
-        tasks.append(Task(title="External Task", category="External"))
+        self.repository.create(Task(title="Later Task", category="Testing"))
 
-        assert len(self.repository._tasks) == 1
-        assert len(tasks) == 2
+        assert isinstance(tasks, tuple)
+        assert len(tasks) == 1
+        assert len(self.repository._tasks) == 2
+
+    def test_iter_all_yields_tasks_in_insertion_order(self):
+        """Test iter_all yields stored tasks in creation order"""
+        task1 = self.repository.create(Task(title="Task 1", category="Category 1"))
+        task2 = self.repository.create(Task(title="Task 2", category="Category 2"))
+
+        tasks = list(self.repository.iter_all())
+
+        assert tasks == [task1, task2]
 
     def test_find_by_id_existing_task(self):
         """Test finding an existing task by ID"""
@@ -131,18 +192,28 @@ class TestInMemoryTaskRepository:
         assert found_task2.id == 2
         assert found_task2.title == "Task 2"
 
+    def test_tasks_are_indexed_by_id(self):
+        """Test that stored tasks are keyed by ID for constant-time lookups"""
+        created_tasks = [
+            self.repository.create(Task(title=f"Task {i}", category="Indexed"))
+            for i in range(3)
+        ]
+        self.repository.delete(created_tasks[1].id)
+
+        assert list(self.repository._tasks) == [1, 3]
+        for task in (created_tasks[0], created_tasks[2]):
+            assert self.repository._tasks[task.id] is task
+            assert self.repository.find_by_id(task.id) is task
+
     def test_update_existing_task(self):
         """Test updating an existing task"""
+        repository = InMemoryTaskRepository(clock=fake_clock())
         original_task = Task(title="Original Task", category="Original")
-        created_task = self.repository.create(original_task)
+        created_task = repository.create(original_task)
         original_created_at = created_task.created_at
 
-        import time
-
-        time.sleep(0.001)
-
         updated_task_data = Task(title="Updated Task", category="Updated")
-        updated_task = self.repository.update(created_task.id, updated_task_data)
+        updated_task = repository.update(created_task.id, updated_task_data)
 
         assert updated_task is not None
         assert updated_task.id == created_task.id
@@ -152,6 +223,19 @@ class TestInMemoryTaskRepository:
         assert updated_task.updated_at != original_created_at
         assert updated_task.updated_at > original_created_at
 
+    def test_update_mutates_stored_task_in_place(self):
+        """Test that update keeps the stored instance and only changes fields"""
+        created_task = self.repository.create(Task(title="Original", category="A"))
+
+        updated_task = self.repository.update(
+            created_task.id, Task(title="Updated", category="B")
+        )
+
+        assert updated_task is created_task
+        assert self.repository.find_by_id(created_task.id) is created_task
+        assert created_task.title == "Updated"
+        assert created_task.category == "B"
+
     def test_update_non_existing_task(self):
         """Test updating a non-existing task"""
         updated_task_data = Task(title="Updated Task", category="Updated")
@@ -252,28 +336,29 @@ class TestInMemoryTaskRepository:
 
     def test_task_timestamps_are_set_correctly(self):
         """Test that timestamps are set correctly on create and update"""
+        start = datetime(2024, 1, 1)
+        repository = InMemoryTaskRepository(clock=fake_clock(start))
         task = Task(title="Test Task", category="Testing")
-        before_create = datetime.now()
-        created_task = self.repository.create(task)
-        after_create = datetime.now()
-
-        assert before_create <= created_task.created_at <= after_create
-        assert before_create <= created_task.updated_at <= after_create
-        assert created_task.created_at == created_task.updated_at
-
-        import time
+        created_task = repository.create(task)
 
-        time.sleep(0.001)
+        assert created_task.created_at == start
+        assert created_task.updated_at == start
 
         updated_task_data = Task(title="Updated Task", category="Updated")
-        before_update = datetime.now()
-        updated_task = self.repository.update(created_task.id, updated_task_data)
-        after_update = datetime.now()
+        updated_task = repository.update(created_task.id, updated_task_data)
 
-        assert updated_task.created_at == created_task.created_at  # Should not change
-        assert before_update <= updated_task.updated_at <= after_update
+        assert updated_task.created_at == start  # Should not change
+        assert updated_task.updated_at == start + timedelta(seconds=1)
         assert updated_task.updated_at > updated_task.created_at
 
+    def test_default_clock_uses_current_time(self):
+        """Test that the repository stamps tasks with the wall clock by default"""
+        before_create = datetime.now()
+        created_task = self.repository.create(Task(title="Test", category="Test"))
+        after_create = datetime.now()
+
+        assert before_create <= created_task.created_at <= after_create
+
     def test_repository_isolation(self):
         """Test that multiple repository instances are isolated"""
         repo1 = InMemoryTaskRepository()
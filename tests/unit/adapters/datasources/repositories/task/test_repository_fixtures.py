@@ -6,8 +6,14 @@ from datetime import datetime
 
 import pytest
 
+from src.adapters.datasources.repositories.task.repository import InMemoryTaskRepository
 from src.core.domain.model import Task
-from tests.conftest import assert_task_equality, assert_task_has_valid_timestamps
+from tests.conftest import (
+    LARGE_REPOSITORY_SIZE,
+    assert_task_equality,
+    assert_task_has_valid_timestamps,
+    fake_clock,
+)
 
 
 class TestInMemoryTaskRepositoryWithFixtures:
@@ -71,10 +77,7 @@ class TestInMemoryTaskRepositoryWithFixtures:
 
     def test_bulk_operations(self, empty_repository, sample_tasks):
         """Test bulk operations on repository"""
-        created_tasks = []
-        for task in sample_tasks:
-            created_task = empty_repository.create(task)
-            created_tasks.append(created_task)
+        created_tasks = empty_repository.create_many(sample_tasks)
 
         assert len(empty_repository.find_all()) == len(sample_tasks)
 
@@ -145,18 +148,15 @@ class TestInMemoryTaskRepositoryEdgeCases:
         assert created_task.title == special_title
         assert created_task.category == special_category
 
-    def test_update_with_same_data(self, empty_repository):
+    def test_update_with_same_data(self):
         """Test updating task with exactly the same data"""
+        repository = InMemoryTaskRepository(clock=fake_clock())
         original_task = Task(title="Original Task", category="Original")
-        created_task = empty_repository.create(original_task)
+        created_task = repository.create(original_task)
         original_updated_at = created_task.updated_at
 
-        import time
-
-        time.sleep(0.001)
-
         same_task_data = Task(title="Original Task", category="Original")
-        updated_task = empty_repository.update(created_task.id, same_task_data)
+        updated_task = repository.update(created_task.id, same_task_data)
 
         assert updated_task is not None
         assert updated_task.title == "Original Task"
@@ -190,11 +190,10 @@ class TestInMemoryTaskRepositoryEdgeCases:
         """Test repository with a large number of tasks"""
         num_tasks = 1000
 
-        created_tasks = []
-        for i in range(num_tasks):
-            task = Task(title=f"Task {i}", category=f"Category {i % 10}")
-            created_task = empty_repository.create(task)
-            created_tasks.append(created_task)
+        created_tasks = empty_repository.create_many(
+            Task(title=f"Task {i}", category=f"Category {i % 10}")
+            for i in range(num_tasks)
+        )
 
         assert len(empty_repository.find_all()) == num_tasks
         assert empty_repository._next_id == num_tasks + 1
@@ -212,22 +211,19 @@ class TestInMemoryTaskRepositoryEdgeCases:
 class TestInMemoryTaskRepositoryPerformance:
     """Test suite for performance-related tests"""
 
-    def test_find_by_id_performance_with_many_tasks(self, empty_repository):
+    def test_find_by_id_performance_with_many_tasks(self, large_repository):
         """Test that find_by_id performance is reasonable with many tasks"""
         import time
 
-        num_tasks = 10000
-        for i in range(num_tasks):
-            task = Task(title=f"Task {i}", category="Performance Test")
-            empty_repository.create(task)
+        num_tasks = LARGE_REPOSITORY_SIZE
 
         start_time = time.time()
 
-        first_task = empty_repository.find_by_id(1)
+        first_task = large_repository.find_by_id(1)
 
-        middle_task = empty_repository.find_by_id(num_tasks // 2)
+        middle_task = large_repository.find_by_id(num_tasks // 2)
 
-        last_task = empty_repository.find_by_id(num_tasks)
+        last_task = large_repository.find_by_id(num_tasks)
 
         end_time = time.time()
 
@@ -240,19 +236,16 @@ class TestInMemoryTaskRepositoryPerformance:
             elapsed_time < 1.0
         ), f"Find operations took too long: {elapsed_time:.3f} seconds"
 
-    def test_find_all_returns_copy_performance(self, empty_repository):
+    def test_find_all_returns_copy_performance(self, large_repository):
         """Test that find_all copy operation performance is reasonable"""
         import time
 
-        num_tasks = 5000
-        for i in range(num_tasks):
-            task = Task(title=f"Task {i}", category="Performance Test")
-            empty_repository.create(task)
+        num_tasks = LARGE_REPOSITORY_SIZE
 
         start_time = time.time()
 
         for _ in range(10):
-            tasks = empty_repository.find_all()
+            tasks = large_repository.find_all()
             assert len(tasks) == num_tasks
 
         end_time = time.time()
@@ -1,320 +1,266 @@
-from datetime import datetime
-from unittest.mock import AsyncMock, Mock
-
 import pytest
-from fastapi import FastAPI, HTTPException
-from fastapi.testclient import TestClient
+from fastapi import HTTPException
 
-from src.adapters.services.task.task_service import TaskService
-from src.adapters.web.controllers.task.task_controller import get_task_service, router
-from src.core.domain.model import Task
+from src.adapters.web.controllers.task.task_controller import get_task_service
 from src.schemas.schemas import DeleteTaskResponse, TaskInput, TaskOutput
 
+# Keep the controller tests on one xdist worker so they share the session client
+pytestmark = pytest.mark.xdist_group("task_controller")
+
+_SERVICE_ERROR = Exception("Service error")
+_JSON_HEADERS = {"content-type": "application/json"}
+_NEW_TASK_JSON = b'{"title":"New Task","category":"New Category"}'
+_EMPTY_TITLE_JSON = b'{"title":"","category":"Category"}'
+_EMPTY_CATEGORY_JSON = b'{"title":"Task Title","category":""}'
+_UPDATED_TASK_JSON = b'{"title":"Updated Task","category":"Updated Category"}'
+_EMPTY_TASK_JSON = b'{"title":"","category":""}'
+
+_TASK1_OUT = TaskOutput(id=1, title="Task 1", category="Category 1")
+_TASK2_OUT = TaskOutput(id=2, title="Task 2", category="Category 2")
+_NEW_TASK_OUT = TaskOutput(id=1, title="New Task", category="New Category")
+_TEST_TASK_OUT = TaskOutput(id=1, title="Test Task", category="Testing")
+_UPDATED_TASK_OUT = TaskOutput(id=1, title="Updated Task", category="Updated Category")
+_EMPTY_TITLE_OUT = TaskOutput(id=1, title="", category="Category")
+_EMPTY_CATEGORY_OUT = TaskOutput(id=1, title="Task Title", category="")
+_EMPTY_TASK_OUT = TaskOutput(id=1, title="", category="")
+_DELETED_OUT = DeleteTaskResponse(message="Task 1 eliminada correctamente")
+_NEW_TASK_IN = TaskInput(title="New Task", category="New Category")
+_UPDATED_TASK_IN = TaskInput(title="Updated Task", category="Updated Category")
+
+
+def _task_json(task_id, title, category):
+    """Helper returning the JSON body of a TaskOutput without timestamps"""
+    return {
+        "id": task_id,
+        "title": title,
+        "category": category,
+        "created_at": None,
+        "updated_at": None,
+    }
+
+
+_EMPTY_TITLE_EXPECTED = _task_json(1, "", "Category")
+_EMPTY_CATEGORY_EXPECTED = _task_json(1, "Task Title", "")
+_EMPTY_TASK_EXPECTED = _task_json(1, "", "")
+_NOT_FOUND_EXPECTED = {"detail": "Task not found"}
+
+HAPPY_PATHS = [
+    pytest.param(
+        "GET",
+        "/tasks/",
+        None,
+        "get_all_tasks",
+        [
+            _TASK1_OUT,
+            _TASK2_OUT,
+        ],
+        (),
+        200,
+        [
+            _task_json(1, "Task 1", "Category 1"),
+            _task_json(2, "Task 2", "Category 2"),
+        ],
+        id="get_all_tasks",
+    ),
+    pytest.param(
+        "POST",
+        "/tasks/",
+        _NEW_TASK_JSON,
+        "create_task",
+        _NEW_TASK_OUT,
+        (_NEW_TASK_IN,),
+        201,
+        _task_json(1, "New Task", "New Category"),
+        id="create_task",
+    ),
+    pytest.param(
+        "GET",
+        "/tasks/1",
+        None,
+        "get_task_by_id",
+        _TEST_TASK_OUT,
+        (1,),
+        200,
+        _task_json(1, "Test Task", "Testing"),
+        id="get_task_by_id",
+    ),
+    pytest.param(
+        "PUT",
+        "/tasks/1",
+        _UPDATED_TASK_JSON,
+        "update_task",
+        _UPDATED_TASK_OUT,
+        (1, _UPDATED_TASK_IN),
+        200,
+        _task_json(1, "Updated Task", "Updated Category"),
+        id="update_task",
+    ),
+    pytest.param(
+        "DELETE",
+        "/tasks/1",
+        None,
+        "delete_task",
+        _DELETED_OUT,
+        (1,),
+        200,
+        {"message": "Task 1 eliminada correctamente"},
+        id="delete_task",
+    ),
+]
+
+
+@pytest.fixture
+def missing_task(request, mock_service):
+    """Fixture that makes the service report the parametrized task id as missing"""
+    mock_service.get_task_by_id.return_value = None
+    return request.param
+
 
 class TestTaskController:
     """Test cases for TaskController endpoints"""
 
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.mock_service = Mock(spec=TaskService)
-        self.mock_service.create_task = AsyncMock()
-        self.mock_service.get_all_tasks = AsyncMock()
-        self.mock_service.get_task_by_id = AsyncMock()
-        self.mock_service.update_task = AsyncMock()
-        self.mock_service.delete_task = AsyncMock()
-
-    def _create_test_app(self):
-        """Helper method to create test app with dependency override"""
-        app = FastAPI()
-        app.include_router(router)
-        app.dependency_overrides[get_task_service] = lambda: self.mock_service
-        return TestClient(app)
-
-    def test_get_task_service_dependency_error(self):
+    async def test_get_task_service_dependency_error(self):
         """Test that get_task_service dependency raises HTTPException"""
         with pytest.raises(HTTPException) as exc_info:
-            get_task_service()
+            await get_task_service()
 
         assert exc_info.value.status_code == 500
         assert exc_info.value.detail == "Service not configured"
 
-    def test_get_all_tasks_success(self):
-        """Test successful get all tasks endpoint"""
-        task1 = TaskOutput(id=1, title="Task 1", category="Category 1")
-        task2 = TaskOutput(id=2, title="Task 2", category="Category 2")
-        self.mock_service.get_all_tasks.return_value = [task1, task2]
-
-        client = self._create_test_app()
-        response = client.get("/tasks/")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 2
-        assert data[0]["id"] == 1
-        assert data[0]["title"] == "Task 1"
-        assert data[1]["id"] == 2
-        assert data[1]["title"] == "Task 2"
-        self.mock_service.get_all_tasks.assert_called_once()
-
-    def test_get_all_tasks_empty_list(self):
+    @pytest.mark.parametrize(
+        "verb, url, body, method, return_value, expected_call, status_code, expected",
+        HAPPY_PATHS,
+    )
+    async def test_happy_path(
+        self,
+        client,
+        mock_service,
+        verb,
+        url,
+        body,
+        method,
+        return_value,
+        expected_call,
+        status_code,
+        expected,
+    ):
+        """Test that each endpoint returns the service result on success"""
+        service_method = getattr(mock_service, method)
+        service_method.return_value = return_value
+        headers = _JSON_HEADERS if body is not None else None
+
+        response = await client.request(verb, url, content=body, headers=headers)
+
+        assert response.status_code == status_code
+        assert response.json() == expected
+        service_method.assert_called_once_with(*expected_call)
+
+    async def test_get_all_tasks_empty_list(self, client, mock_service):
         """Test get all tasks when no tasks exist"""
-        self.mock_service.get_all_tasks.return_value = []
+        mock_service.get_all_tasks.return_value = []
 
-        client = self._create_test_app()
-        response = client.get("/tasks/")
+        response = await client.get("/tasks/")
 
         assert response.status_code == 200
-        data = response.json()
-        assert data == []
-        self.mock_service.get_all_tasks.assert_called_once()
-
-    def test_create_task_success(self):
-        """Test successful task creation endpoint"""
-        task_input = TaskInput(title="New Task", category="New Category")
-        created_task = TaskOutput(id=1, title="New Task", category="New Category")
-        self.mock_service.create_task.return_value = created_task
-
-        client = self._create_test_app()
-        response = client.post("/tasks/", json=task_input.model_dump())
+        assert response.json() == []
+        mock_service.get_all_tasks.assert_called_once()
 
-        assert response.status_code == 201
-        data = response.json()
-        assert data["id"] == 1
-        assert data["title"] == "New Task"
-        assert data["category"] == "New Category"
-        self.mock_service.create_task.assert_called_once()
-
-    def test_create_task_with_empty_title(self):
+    async def test_create_task_with_empty_title(self, client, mock_service):
         """Test task creation with empty title"""
-        task_input = TaskInput(title="", category="Category")
-        created_task = TaskOutput(id=1, title="", category="Category")
-        self.mock_service.create_task.return_value = created_task
+        mock_service.create_task.return_value = _EMPTY_TITLE_OUT
 
-        client = self._create_test_app()
-        response = client.post("/tasks/", json=task_input.model_dump())
+        response = await client.post(
+            "/tasks/", content=_EMPTY_TITLE_JSON, headers=_JSON_HEADERS
+        )
 
         assert response.status_code == 201
-        data = response.json()
-        assert data["title"] == ""
-        self.mock_service.create_task.assert_called_once()
+        assert response.json() == _EMPTY_TITLE_EXPECTED
+        mock_service.create_task.assert_called_once()
 
-    def test_create_task_with_empty_category(self):
+    async def test_create_task_with_empty_category(self, client, mock_service):
         """Test task creation with empty category"""
-        task_input = TaskInput(title="Task Title", category="")
-        created_task = TaskOutput(id=1, title="Task Title", category="")
-        self.mock_service.create_task.return_value = created_task
+        mock_service.create_task.return_value = _EMPTY_CATEGORY_OUT
 
-        client = self._create_test_app()
-        response = client.post("/tasks/", json=task_input.model_dump())
+        response = await client.post(
+            "/tasks/", content=_EMPTY_CATEGORY_JSON, headers=_JSON_HEADERS
+        )
 
         assert response.status_code == 201
-        data = response.json()
-        assert data["category"] == ""
-        self.mock_service.create_task.assert_called_once()
-
-    def test_get_task_by_id_success(self):
-        """Test successful get task by ID endpoint"""
-        task_id = 1
-        task = TaskOutput(id=task_id, title="Test Task", category="Testing")
-        self.mock_service.get_task_by_id.return_value = task
+        assert response.json() == _EMPTY_CATEGORY_EXPECTED
+        mock_service.create_task.assert_called_once()
 
-        client = self._create_test_app()
-        response = client.get(f"/tasks/{task_id}")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == task_id
-        assert data["title"] == "Test Task"
-        assert data["category"] == "Testing"
-        self.mock_service.get_task_by_id.assert_called_once_with(task_id)
-
-    def test_get_task_by_id_not_found(self):
+    @pytest.mark.parametrize(
+        "missing_task", [999, 0, -1], ids=["missing", "zero", "negative"], indirect=True
+    )
+    async def test_get_task_by_id_not_found(self, client, mock_service, missing_task):
         """Test get task by ID when task doesn't exist"""
-        task_id = 999
-        self.mock_service.get_task_by_id.return_value = None
-
-        client = self._create_test_app()
-        response = client.get(f"/tasks/{task_id}")
-
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Task not found"
-        self.mock_service.get_task_by_id.assert_called_once_with(task_id)
-
-    def test_get_task_by_id_with_zero_id(self):
-        """Test get task by ID with zero ID"""
-        task_id = 0
-        self.mock_service.get_task_by_id.return_value = None
-
-        client = self._create_test_app()
-        response = client.get(f"/tasks/{task_id}")
-
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Task not found"
-        self.mock_service.get_task_by_id.assert_called_once_with(task_id)
-
-    def test_get_task_by_id_with_negative_id(self):
-        """Test get task by ID with negative ID"""
-        task_id = -1
-        self.mock_service.get_task_by_id.return_value = None
-
-        client = self._create_test_app()
-        response = client.get(f"/tasks/{task_id}")
+        response = await client.get(f"/tasks/{missing_task}")
 
         assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Task not found"
-        self.mock_service.get_task_by_id.assert_called_once_with(task_id)
-
-    def test_update_task_success(self):
-        """Test successful task update endpoint"""
-        task_id = 1
-        task_input = TaskInput(title="Updated Task", category="Updated Category")
-        updated_task = TaskOutput(
-            id=task_id, title="Updated Task", category="Updated Category"
-        )
-        self.mock_service.update_task.return_value = updated_task
-
-        client = self._create_test_app()
-        response = client.put(f"/tasks/{task_id}", json=task_input.model_dump())
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == task_id
-        assert data["title"] == "Updated Task"
-        assert data["category"] == "Updated Category"
-        self.mock_service.update_task.assert_called_once()
+        assert response.json() == _NOT_FOUND_EXPECTED
+        mock_service.get_task_by_id.assert_called_once_with(missing_task)
 
-    def test_update_task_not_found(self):
+    async def test_update_task_not_found(self, client, mock_service):
         """Test update task when task doesn't exist"""
         task_id = 999
-        task_input = TaskInput(title="Updated Task", category="Updated Category")
-        self.mock_service.update_task.return_value = None
+        mock_service.update_task.return_value = None
 
-        client = self._create_test_app()
-        response = client.put(f"/tasks/{task_id}", json=task_input.model_dump())
+        response = await client.put(
+            f"/tasks/{task_id}", content=_UPDATED_TASK_JSON, headers=_JSON_HEADERS
+        )
 
         assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Task not found"
-        self.mock_service.update_task.assert_called_once()
+        assert response.json() == _NOT_FOUND_EXPECTED
+        mock_service.update_task.assert_called_once()
 
-    def test_update_task_with_empty_data(self):
+    async def test_update_task_with_empty_data(self, client, mock_service):
         """Test update task with empty title and category"""
         task_id = 1
-        task_input = TaskInput(title="", category="")
-        updated_task = TaskOutput(id=task_id, title="", category="")
-        self.mock_service.update_task.return_value = updated_task
-
-        client = self._create_test_app()
-        response = client.put(f"/tasks/{task_id}", json=task_input.model_dump())
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["title"] == ""
-        assert data["category"] == ""
-        self.mock_service.update_task.assert_called_once()
+        mock_service.update_task.return_value = _EMPTY_TASK_OUT
 
-    def test_delete_task_success(self):
-        """Test successful task deletion endpoint"""
-        task_id = 1
-        delete_response = DeleteTaskResponse(
-            message=f"Task {task_id} eliminada correctamente"
+        response = await client.put(
+            f"/tasks/{task_id}", content=_EMPTY_TASK_JSON, headers=_JSON_HEADERS
         )
-        self.mock_service.delete_task.return_value = delete_response
-
-        client = self._create_test_app()
-        response = client.delete(f"/tasks/{task_id}")
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["message"] == f"Task {task_id} eliminada correctamente"
-        self.mock_service.delete_task.assert_called_once_with(task_id)
+        assert response.json() == _EMPTY_TASK_EXPECTED
+        mock_service.update_task.assert_called_once()
 
-    def test_delete_task_not_found(self):
+    @pytest.mark.parametrize(
+        "task_id", [999, 0, -1], ids=["missing", "zero", "negative"]
+    )
+    async def test_delete_task_not_found(self, client, mock_service, task_id):
         """Test delete task when task doesn't exist"""
-        task_id = 999
-        delete_response = DeleteTaskResponse(message=f"Task {task_id} no encontrada")
-        self.mock_service.delete_task.return_value = delete_response
-
-        client = self._create_test_app()
-        response = client.delete(f"/tasks/{task_id}")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["message"] == f"Task {task_id} no encontrada"
-        self.mock_service.delete_task.assert_called_once_with(task_id)
-
-    def test_delete_task_with_zero_id(self):
-        """Test delete task with zero ID"""
-        task_id = 0
         delete_response = DeleteTaskResponse(message=f"Task {task_id} no encontrada")
-        self.mock_service.delete_task.return_value = delete_response
+        mock_service.delete_task.return_value = delete_response
 
-        client = self._create_test_app()
-        response = client.delete(f"/tasks/{task_id}")
+        response = await client.delete(f"/tasks/{task_id}")
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["message"] == f"Task {task_id} no encontrada"
-        self.mock_service.delete_task.assert_called_once_with(task_id)
-
-    def test_delete_task_with_negative_id(self):
-        """Test delete task with negative ID"""
-        task_id = -1
-        delete_response = DeleteTaskResponse(message=f"Task {task_id} no encontrada")
-        self.mock_service.delete_task.return_value = delete_response
-
-        client = self._create_test_app()
-        response = client.delete(f"/tasks/{task_id}")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["message"] == f"Task {task_id} no encontrada"
-        self.mock_service.delete_task.assert_called_once_with(task_id)
+        assert response.json() == {"message": f"Task {task_id} no encontrada"}
+        mock_service.delete_task.assert_called_once_with(task_id)
 
 
 class TestTaskControllerEdgeCases:
     """Edge cases and error scenarios for TaskController"""
 
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.mock_service = Mock(spec=TaskService)
-        self.mock_service.create_task = AsyncMock()
-        self.mock_service.get_all_tasks = AsyncMock()
-        self.mock_service.get_task_by_id = AsyncMock()
-        self.mock_service.update_task = AsyncMock()
-        self.mock_service.delete_task = AsyncMock()
-
-    def _create_test_app(self):
-        """Helper method to create test app with dependency override"""
-        app = FastAPI()
-        app.include_router(router)
-        app.dependency_overrides[get_task_service] = lambda: self.mock_service
-        return TestClient(app)
-
-    def test_invalid_json_payload(self):
+    async def test_invalid_json_payload(self, client, mock_service):
         """Test controller with invalid JSON payload"""
-        client = self._create_test_app()
-        response = client.post("/tasks/", json={"invalid": "data"})
+        response = await client.post("/tasks/", json={"invalid": "data"})
 
         assert response.status_code == 422  # Validation error
 
-    def test_missing_required_fields(self):
+    async def test_missing_required_fields(self, client, mock_service):
         """Test controller with missing required fields"""
-        client = self._create_test_app()
-        response = client.post("/tasks/", json={"title": "Only title"})
+        response = await client.post("/tasks/", json={"title": "Only title"})
 
         assert response.status_code == 422  # Validation error
 
-    def test_service_exception_handling(self):
-        """Test controller handles service exceptions gracefully"""
-        self.mock_service.get_all_tasks.side_effect = Exception("Service error")
-
-        client = self._create_test_app()
+    async def test_service_exception_handling(self, client, mock_service):
+        """Test controller lets unexpected service errors reach the app middleware"""
+        mock_service.get_all_tasks.side_effect = _SERVICE_ERROR
 
-        response = client.get("/tasks/")
+        with pytest.raises(Exception) as exc_info:
+            await client.get("/tasks/")
 
-        assert response.status_code == 500
-        assert response.json()["detail"] == "Internal server error"
+        assert exc_info.value is _SERVICE_ERROR
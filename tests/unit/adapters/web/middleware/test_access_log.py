@@ -0,0 +1,47 @@
+from unittest.mock import Mock
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.adapters.web.middleware.access_log import AccessLogASGI
+from src.core.platform.logging import Logger
+
+
+class TestAccessLogASGI:
+    """Test cases for AccessLogASGI middleware"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        app = FastAPI()
+
+        @app.get("/ping")
+        async def ping():
+            return {"status": "ok"}
+
+        @app.get("/missing")
+        async def missing():
+            raise HTTPException(status_code=404, detail="Not found")
+
+        self.mock_logger = Mock(spec=Logger)
+        app.add_middleware(AccessLogASGI, logger=self.mock_logger)
+        self.client = TestClient(app)
+
+    def test_logs_method_path_and_status(self):
+        """Test that a single access line is logged per request"""
+        response = self.client.get("/ping")
+
+        assert response.status_code == 200
+        self.mock_logger.info.assert_called_once()
+        args = self.mock_logger.info.call_args[0]
+        message = args[0] % args[1:]
+        assert message.startswith("GET /ping 200 ")
+        assert message.endswith("ms")
+
+    def test_logs_error_status(self):
+        """Test that the status of error responses is logged"""
+        response = self.client.get("/missing")
+
+        assert response.status_code == 404
+        args = self.mock_logger.info.call_args[0]
+        message = args[0] % args[1:]
+        assert message.startswith("GET /missing 404 ")
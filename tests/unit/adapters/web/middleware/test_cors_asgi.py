@@ -0,0 +1,87 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapters.web.middleware.cors_asgi import ASGICors
+
+
+class TestASGICors:
+    """Test cases for ASGICors middleware"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        app = FastAPI()
+
+        @app.get("/ping")
+        async def ping():
+            return {"status": "ok"}
+
+        app.add_middleware(ASGICors)
+        self.client = TestClient(app)
+
+    def test_adds_cors_headers_to_response(self):
+        """Test that only the allow-origin header is added to regular responses"""
+        response = self.client.get("/ping", headers={"Origin": "http://example.com"})
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert "access-control-allow-methods" not in response.headers
+        assert "access-control-allow-headers" not in response.headers
+
+    def test_adds_cors_headers_to_not_found_response(self):
+        """Test that CORS headers are added to error responses"""
+        response = self.client.get("/missing")
+
+        assert response.status_code == 404
+        assert response.headers["access-control-allow-origin"] == "*"
+
+    def test_preflight_request_short_circuits(self):
+        """Test that OPTIONS preflight is answered without routing"""
+        response = self.client.options(
+            "/missing",
+            headers={
+                "Origin": "http://example.com",
+                "Access-Control-Request-Method": "POST",
+            },
+        )
+
+        assert response.status_code == 204
+        assert response.content == b""
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert (
+            response.headers["access-control-allow-methods"]
+            == "GET,POST,PUT,DELETE,OPTIONS,PATCH"
+        )
+        assert response.headers["access-control-allow-headers"] == "*"
+        assert response.headers["access-control-max-age"] == "600"
+
+    def test_preflight_echoes_requested_headers(self):
+        """Test that requested headers are echoed back on preflight"""
+        response = self.client.options(
+            "/missing",
+            headers={
+                "Origin": "http://example.com",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "Authorization",
+            },
+        )
+
+        assert response.status_code == 204
+        assert response.headers["access-control-allow-headers"] == "Authorization"
+
+    def test_plain_options_request_reaches_the_app(self):
+        """Test that OPTIONS without preflight headers is routed normally"""
+        response = self.client.options("/ping")
+
+        assert response.status_code == 405
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert "access-control-max-age" not in response.headers
+
+    def test_options_request_to_unknown_path_is_not_found(self):
+        """Test that OPTIONS to an unknown path without preflight headers is a 404"""
+        response = self.client.options(
+            "/nope", headers={"Origin": "http://example.com"}
+        )
+
+        assert response.status_code == 404
+        assert response.headers["access-control-allow-origin"] == "*"
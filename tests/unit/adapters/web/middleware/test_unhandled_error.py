@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapters.web import exception_handlers
+from src.adapters.web.middleware.unhandled_error import UnhandledErrorASGI
+
+
+class TestUnhandledErrorASGI:
+    """Test cases for UnhandledErrorASGI middleware"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        app = FastAPI()
+
+        @app.get("/ping")
+        async def ping():
+            return {"status": "ok"}
+
+        @app.get("/boom")
+        async def boom():
+            raise Exception("Service error")
+
+        app.add_middleware(UnhandledErrorASGI)
+        self.client = TestClient(app)
+
+    def test_passes_through_successful_responses(self):
+        """Test that regular responses are left untouched"""
+        response = self.client.get("/ping")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    def test_unexpected_error_becomes_500_without_reraising(self):
+        """Test that an unexpected error is answered and not re-raised"""
+        with patch.object(exception_handlers, "logger") as mock_logger:
+            response = self.client.get("/boom")
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "Internal server error"}
+        mock_logger.log_exception.assert_called_once()
@@ -0,0 +1,34 @@
+import json
+from unittest.mock import patch
+
+from fastapi import Request
+
+from src.adapters.web import exception_handlers
+from src.adapters.web.exception_handlers import unhandled_exception_handler
+
+
+def _request(method: str, path: str) -> Request:
+    return Request({"type": "http", "method": method, "path": path, "headers": []})
+
+
+class TestUnhandledExceptionHandler:
+    """Test cases for unhandled_exception_handler"""
+
+    async def test_returns_generic_500_response(self):
+        """Test that unexpected errors become a generic 500 JSON response"""
+        with patch.object(exception_handlers, "logger"):
+            response = await unhandled_exception_handler(
+                _request("GET", "/tasks/"), Exception("Service error")
+            )
+
+        assert response.status_code == 500
+        assert json.loads(response.body) == {"detail": "Internal server error"}
+
+    async def test_logs_request_and_exception(self):
+        """Test that the failing request is logged once with its exception"""
+        error = Exception("Service error")
+
+        with patch.object(exception_handlers, "logger") as mock_logger:
+            await unhandled_exception_handler(_request("GET", "/tasks/"), error)
+
+        mock_logger.log_exception.assert_called_once_with("GET /tasks/", error)
@@ -0,0 +1,114 @@
+import logging
+from unittest.mock import patch
+
+from src.core.platform.logging import CachedTimeFormatter, Logger, LoggerFactory
+
+DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+
+def _record(created: float) -> logging.LogRecord:
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+    record.created = created
+    record.msecs = (created - int(created)) * 1000
+    return record
+
+
+class TestCachedTimeFormatter:
+    """Test cases for CachedTimeFormatter"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.formatter = CachedTimeFormatter("%(asctime)s", datefmt=DATEFMT)
+        self.reference = logging.Formatter("%(asctime)s", datefmt=DATEFMT)
+
+    def test_matches_standard_formatter(self):
+        """Test that the cached output matches logging.Formatter"""
+        record = _record(1700000000.25)
+
+        assert self.formatter.formatTime(record, DATEFMT) == (
+            self.reference.formatTime(record, DATEFMT)
+        )
+
+    def test_reuses_time_within_same_second(self):
+        """Test that records within one second format the time only once"""
+        with patch.object(
+            logging.Formatter, "formatTime", return_value="cached"
+        ) as format_time:
+            first = self.formatter.formatTime(_record(1700000000.1), DATEFMT)
+            second = self.formatter.formatTime(_record(1700000000.9), DATEFMT)
+
+        assert first == second == "cached"
+        format_time.assert_called_once()
+
+    def test_default_datefmt_keeps_milliseconds(self):
+        """Test that records without a datefmt keep their own milliseconds"""
+        formatter = CachedTimeFormatter("%(asctime)s")
+        reference = logging.Formatter("%(asctime)s")
+        first = _record(1700000000.099)
+        second = _record(1700000000.9)
+
+        formatter.formatTime(first)
+
+        assert formatter.formatTime(second) == reference.formatTime(second)
+
+    def test_refreshes_time_on_next_second(self):
+        """Test that a new second produces a new timestamp"""
+        first = self.formatter.formatTime(_record(1700000000.5), DATEFMT)
+        second = self.formatter.formatTime(_record(1700000001.5), DATEFMT)
+
+        assert first != second
+
+
+class TestLoggerHandlers:
+    """Test cases for the shared console handler"""
+
+    def test_handler_is_attached_once(self):
+        """Test that building many loggers leaves a single console handler"""
+        for name in ("handlers_a", "handlers_b", "handlers_c"):
+            Logger(name)
+            LoggerFactory.get_logger(name)
+            LoggerFactory.get_logger(name)
+
+        console_handlers = [
+            handler
+            for handler in logging.getLogger().handlers
+            if isinstance(handler.formatter, CachedTimeFormatter)
+        ]
+        assert len(console_handlers) == 1
+
+
+class _StrCounter:
+    """Object that records how many times it is rendered as a string"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "counter"
+
+
+class TestLoggerLevels:
+    """Test cases for level-guarded lazy logging"""
+
+    def test_disabled_level_skips_underlying_call(self):
+        """Test that logging.Logger is not called below the logger level"""
+        logger = Logger("levels_disabled", logging.WARNING)
+        counter = _StrCounter()
+
+        with patch.object(logger.logger, "debug") as debug:
+            logger.debug("%s", counter)
+
+        debug.assert_not_called()
+        assert counter.calls == 0
+
+    def test_enabled_level_forwards_unformatted_arguments(self):
+        """Test that message and arguments reach logging.Logger unformatted"""
+        logger = Logger("levels_enabled", logging.DEBUG)
+        counter = _StrCounter()
+
+        with patch.object(logger.logger, "debug") as debug:
+            logger.debug("value %s", counter, request_id="abc")
+
+        debug.assert_called_once_with("value %s", counter, extra={"request_id": "abc"})
+        assert counter.calls == 0
@@ -1,6 +1,3 @@
-from datetime import datetime
-from unittest.mock import MagicMock, Mock
-
 import pytest
 
 from src.core.domain.model import Task
@@ -13,187 +10,173 @@ from src.core.use_cases.task_use_cases import (
     UpdateTaskUseCase,
 )
 
+# Shared read-only values; the use cases only pass them through the fake repository
+_NEW_TASK = Task(title="Test Task", category="Testing")
+_CREATED_TASK = Task(id=1, title="Test Task", category="Testing")
+_UPDATE_FIELDS = Task(title="Updated Task", category="Updated")
+_UPDATED_TASK = Task(id=1, title="Updated Task", category="Updated")
+_TASK_1 = Task(id=1, title="Task 1", category="Category 1")
+_TASK_2 = Task(id=2, title="Task 2", category="Category 2")
+
+FLOW_SCENARIOS = [
+    pytest.param(
+        [
+            (
+                CreateTaskUseCase,
+                ("Test Task", "Testing"),
+                ("create", (_NEW_TASK,)),
+                _CREATED_TASK,
+            ),
+            (GetTaskByIdUseCase, (1,), ("find_by_id", (1,)), _CREATED_TASK),
+        ],
+        id="create_get",
+    ),
+    pytest.param(
+        [
+            (
+                CreateTaskUseCase,
+                ("Test Task", "Testing"),
+                ("create", (_NEW_TASK,)),
+                _CREATED_TASK,
+            ),
+            (
+                UpdateTaskUseCase,
+                (1, "Updated Task", "Updated"),
+                ("update", (1, _UPDATE_FIELDS)),
+                _UPDATED_TASK,
+            ),
+            (DeleteTaskUseCase, (1,), ("delete", (1,)), True),
+        ],
+        id="create_update_delete",
+    ),
+]
+
+
+@pytest.fixture(autouse=True)
+def wire_use_case(request, task_context, fake_repository):
+    """Fixture that binds the fake repository and the class use case to each test"""
+    test = request.instance
+    test.context = task_context
+    test.repository = fake_repository
+    use_case_cls = getattr(test, "use_case_cls", None)
+    if use_case_cls is not None:
+        test.use_case = use_case_cls(task_context)
+
 
 class TestCreateTaskUseCase:
     """Test cases for CreateTaskUseCase"""
 
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.mock_context = Mock()
-        self.mock_repository = Mock()
-        self.mock_context.repositories.task = self.mock_repository
-        self.use_case = CreateTaskUseCase(self.mock_context)
+    use_case_cls = CreateTaskUseCase
 
     def test_create_task_success(self):
         """Test successful task creation"""
-        title = "Test Task"
-        category = "Testing"
-        expected_task = Task(id=1, title=title, category=category)
-        self.mock_repository.create.return_value = expected_task
+        self.repository.return_values["create"] = _CREATED_TASK
 
-        result = self.use_case.execute(title, category)
+        result = self.use_case.execute("Test Task", "Testing")
 
-        assert result == expected_task
-        self.mock_repository.create.assert_called_once()
-        created_task = self.mock_repository.create.call_args[0][0]
-        assert created_task.title == title
-        assert created_task.category == category
-
-    def test_create_task_with_empty_title(self):
-        """Test task creation with empty title"""
-        title = ""
-        category = "Testing"
+        assert result is _CREATED_TASK
+        assert self.repository.calls == [("create", (_NEW_TASK,))]
+
+    @pytest.mark.parametrize(
+        "title, category",
+        [("", "Testing"), ("Test Task", "")],
+        ids=["empty_title", "empty_category"],
+    )
+    def test_create_task_with_empty_field(self, title, category):
+        """Test task creation with an empty title or category"""
         expected_task = Task(id=1, title=title, category=category)
-        self.mock_repository.create.return_value = expected_task
+        self.repository.return_values["create"] = expected_task
 
         result = self.use_case.execute(title, category)
 
         assert result == expected_task
-        self.mock_repository.create.assert_called_once()
+        assert len(self.repository.called("create")) == 1
 
-    def test_create_task_with_empty_category(self):
-        """Test task creation with empty category"""
-        title = "Test Task"
-        category = ""
-        expected_task = Task(id=1, title=title, category=category)
-        self.mock_repository.create.return_value = expected_task
+    def test_create_task_without_repositories(self):
+        """Test task creation fails when repositories are not initialized"""
+        use_case = CreateTaskUseCase(Context(repositories=None))
 
-        result = self.use_case.execute(title, category)
-
-        assert result == expected_task
-        self.mock_repository.create.assert_called_once()
+        with pytest.raises(ValueError, match="Repositories not initialized"):
+            use_case.execute("Test Task", "Testing")
 
 
 class TestGetAllTasksUseCase:
     """Test cases for GetAllTasksUseCase"""
 
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.mock_context = Mock()
-        self.mock_repository = Mock()
-        self.mock_context.repositories.task = self.mock_repository
-        self.use_case = GetAllTasksUseCase(self.mock_context)
+    use_case_cls = GetAllTasksUseCase
 
     def test_get_all_tasks_empty_list(self):
         """Test getting all tasks when repository is empty"""
 
-        self.mock_repository.find_all.return_value = []
+        self.repository.return_values["find_all"] = ()
 
         result = self.use_case.execute()
 
-        assert result == []
-        self.mock_repository.find_all.assert_called_once()
+        assert result == ()
+        assert self.repository.calls == [("find_all", ())]
 
     def test_get_all_tasks_with_tasks(self):
         """Test getting all tasks when repository has tasks"""
 
-        task1 = Task(id=1, title="Task 1", category="Category 1")
-        task2 = Task(id=2, title="Task 2", category="Category 2")
-        expected_tasks = [task1, task2]
-        self.mock_repository.find_all.return_value = expected_tasks
+        expected_tasks = (_TASK_1, _TASK_2)
+        self.repository.return_values["find_all"] = expected_tasks
 
         result = self.use_case.execute()
 
         assert result == expected_tasks
         assert len(result) == 2
-        self.mock_repository.find_all.assert_called_once()
+        assert self.repository.calls == [("find_all", ())]
 
-    def test_get_all_tasks_returns_copy(self):
-        """Test that get_all_tasks returns a copy of the repository data"""
+    def test_iter_execute_returns_repository_iterator(self):
+        """Test iterating all tasks delegates to the repository iterator"""
 
-        task = Task(id=1, title="Test Task", category="Testing")
-        self.mock_repository.find_all.return_value = [task]
+        self.repository.return_values["iter_all"] = iter([_CREATED_TASK])
 
-        result = self.use_case.execute()
+        result = list(self.use_case.iter_execute())
 
-        assert result == [task]
-        self.mock_repository.find_all.assert_called_once()
+        assert result == [_CREATED_TASK]
+        assert self.repository.calls == [("iter_all", ())]
 
 
 class TestGetTaskByIdUseCase:
     """Test cases for GetTaskByIdUseCase"""
 
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.mock_context = Mock()
-        self.mock_repository = Mock()
-        self.mock_context.repositories.task = self.mock_repository
-        self.use_case = GetTaskByIdUseCase(self.mock_context)
-
-    def test_get_task_by_id_existing_task(self):
-        """Test getting an existing task by ID"""
-
-        task_id = 1
-        expected_task = Task(id=task_id, title="Test Task", category="Testing")
-        self.mock_repository.find_by_id.return_value = expected_task
-
-        result = self.use_case.execute(task_id)
-
-        assert result == expected_task
-        self.mock_repository.find_by_id.assert_called_once_with(task_id)
-
-    def test_get_task_by_id_non_existing_task(self):
-        """Test getting a non-existing task by ID"""
-
-        task_id = 999
-        self.mock_repository.find_by_id.return_value = None
-
-        result = self.use_case.execute(task_id)
-
-        assert result is None
-        self.mock_repository.find_by_id.assert_called_once_with(task_id)
-
-    def test_get_task_by_id_with_zero_id(self):
-        """Test getting task with zero ID"""
-
-        task_id = 0
-        self.mock_repository.find_by_id.return_value = None
-
-        result = self.use_case.execute(task_id)
-
-        assert result is None
-        self.mock_repository.find_by_id.assert_called_once_with(task_id)
-
-    def test_get_task_by_id_with_negative_id(self):
-        """Test getting task with negative ID"""
-
-        task_id = -1
-        self.mock_repository.find_by_id.return_value = None
+    use_case_cls = GetTaskByIdUseCase
+
+    @pytest.mark.parametrize(
+        "task_id, expected",
+        [
+            (1, _CREATED_TASK),
+            (999, None),
+            (0, None),
+            (-1, None),
+        ],
+        ids=["existing", "non_existing", "zero", "negative"],
+    )
+    def test_get_task_by_id(self, task_id, expected):
+        """Test getting a task by ID returns whatever the repository finds"""
+        self.repository.return_values["find_by_id"] = expected
 
         result = self.use_case.execute(task_id)
 
-        assert result is None
-        self.mock_repository.find_by_id.assert_called_once_with(task_id)
+        assert result == expected
+        assert self.repository.calls == [("find_by_id", (task_id,))]
 
 
 class TestUpdateTaskUseCase:
     """Test cases for UpdateTaskUseCase"""
 
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.mock_context = Mock()
-        self.mock_repository = Mock()
-        self.mock_context.repositories.task = self.mock_repository
-        self.use_case = UpdateTaskUseCase(self.mock_context)
+    use_case_cls = UpdateTaskUseCase
 
     def test_update_task_success(self):
         """Test successful task update"""
 
-        task_id = 1
-        title = "Updated Task"
-        category = "Updated Category"
-        expected_task = Task(id=task_id, title=title, category=category)
-        self.mock_repository.update.return_value = expected_task
+        self.repository.return_values["update"] = _UPDATED_TASK
 
-        result = self.use_case.execute(task_id, title, category)
+        result = self.use_case.execute(1, "Updated Task", "Updated")
 
-        assert result == expected_task
-        self.mock_repository.update.assert_called_once()
-        call_args = self.mock_repository.update.call_args
-        assert call_args[0][0] == task_id
-        updated_task = call_args[0][1]
-        assert updated_task.title == title
-        assert updated_task.category == category
+        assert result is _UPDATED_TASK
+        assert self.repository.calls == [("update", (1, _UPDATE_FIELDS))]
 
     def test_update_task_non_existing(self):
         """Test updating a non-existing task"""
@@ -201,146 +184,58 @@ class TestUpdateTaskUseCase:
         task_id = 999
         title = "Updated Task"
         category = "Updated Category"
-        self.mock_repository.update.return_value = None
 
         result = self.use_case.execute(task_id, title, category)
 
         assert result is None
-        self.mock_repository.update.assert_called_once()
+        assert len(self.repository.called("update")) == 1
 
-    def test_update_task_with_empty_title(self):
-        """Test updating task with empty title"""
+    @pytest.mark.parametrize(
+        "title, category",
+        [("", "Updated Category"), ("Updated Task", "")],
+        ids=["empty_title", "empty_category"],
+    )
+    def test_update_task_with_empty_field(self, title, category):
+        """Test updating task with an empty title or category"""
 
         task_id = 1
-        title = ""
-        category = "Updated Category"
-        expected_task = Task(id=task_id, title=title, category=category)
-        self.mock_repository.update.return_value = expected_task
-
-        result = self.use_case.execute(task_id, title, category)
-
-        assert result == expected_task
-        self.mock_repository.update.assert_called_once()
-
-    def test_update_task_with_empty_category(self):
-        """Test updating task with empty category"""
-
-        task_id = 1
-        title = "Updated Task"
-        category = ""
         expected_task = Task(id=task_id, title=title, category=category)
-        self.mock_repository.update.return_value = expected_task
+        self.repository.return_values["update"] = expected_task
 
         result = self.use_case.execute(task_id, title, category)
 
         assert result == expected_task
-        self.mock_repository.update.assert_called_once()
+        assert len(self.repository.called("update")) == 1
 
 
 class TestDeleteTaskUseCase:
     """Test cases for DeleteTaskUseCase"""
 
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.mock_context = Mock()
-        self.mock_repository = Mock()
-        self.mock_context.repositories.task = self.mock_repository
-        self.use_case = DeleteTaskUseCase(self.mock_context)
+    use_case_cls = DeleteTaskUseCase
 
-    def test_delete_task_success(self):
-        """Test successful task deletion"""
-
-        task_id = 1
-        self.mock_repository.delete.return_value = True
-
-        result = self.use_case.execute(task_id)
-
-        assert result is True
-        self.mock_repository.delete.assert_called_once_with(task_id)
-
-    def test_delete_task_non_existing(self):
-        """Test deleting a non-existing task"""
-
-        task_id = 999
-        self.mock_repository.delete.return_value = False
+    @pytest.mark.parametrize(
+        "task_id, expected",
+        [(1, True), (999, False), (0, False), (-1, False)],
+        ids=["existing", "non_existing", "zero", "negative"],
+    )
+    def test_delete_task(self, task_id, expected):
+        """Test deleting a task returns whether the repository removed it"""
+        self.repository.return_values["delete"] = expected
 
         result = self.use_case.execute(task_id)
 
-        assert result is False
-        self.mock_repository.delete.assert_called_once_with(task_id)
-
-    def test_delete_task_with_zero_id(self):
-        """Test deleting task with zero ID"""
-
-        task_id = 0
-        self.mock_repository.delete.return_value = False
-
-        result = self.use_case.execute(task_id)
-
-        assert result is False
-        self.mock_repository.delete.assert_called_once_with(task_id)
-
-    def test_delete_task_with_negative_id(self):
-        """Test deleting task with negative ID"""
-
-        task_id = -1
-        self.mock_repository.delete.return_value = False
-
-        result = self.use_case.execute(task_id)
-
-        assert result is False
-        self.mock_repository.delete.assert_called_once_with(task_id)
+        assert result is expected
+        assert self.repository.calls == [("delete", (task_id,))]
 
 
 class TestUseCasesIntegration:
     """Integration tests for use cases working together"""
 
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.mock_context = Mock()
-        self.mock_repository = Mock()
-        self.mock_context.repositories.task = self.mock_repository
-
-    def test_create_and_get_task_flow(self):
-        """Test the flow of creating and then getting a task"""
-
-        create_use_case = CreateTaskUseCase(self.mock_context)
-        get_use_case = GetTaskByIdUseCase(self.mock_context)
-
-        created_task = Task(id=1, title="Test Task", category="Testing")
-        self.mock_repository.create.return_value = created_task
-        self.mock_repository.find_by_id.return_value = created_task
-
-        result_create = create_use_case.execute("Test Task", "Testing")
-        result_get = get_use_case.execute(1)
-
-        assert result_create == created_task
-        assert result_get == created_task
-        self.mock_repository.create.assert_called_once()
-        self.mock_repository.find_by_id.assert_called_once_with(1)
-
-    def test_create_update_delete_flow(self):
-        """Test the flow of creating, updating, and deleting a task"""
-
-        create_use_case = CreateTaskUseCase(self.mock_context)
-        update_use_case = UpdateTaskUseCase(self.mock_context)
-        delete_use_case = DeleteTaskUseCase(self.mock_context)
-
-        created_task = Task(id=1, title="Test Task", category="Testing")
-        updated_task = Task(id=1, title="Updated Task", category="Updated")
-
-        self.mock_repository.create.return_value = created_task
-        self.mock_repository.update.return_value = updated_task
-        self.mock_repository.delete.return_value = True
-
-        result_create = create_use_case.execute("Test Task", "Testing")
-        result_update = update_use_case.execute(1, "Updated Task", "Updated")
-        result_delete = delete_use_case.execute(1)
-
-        assert result_create == created_task
-        assert result_update == updated_task
-        assert result_delete is True
+    @pytest.mark.parametrize("steps", FLOW_SCENARIOS)
+    def test_flow(self, steps):
+        """Test that chained use cases make each repository call in order"""
+        for use_case_cls, args, (method, _), return_value in steps:
+            self.repository.return_values[method] = return_value
+            assert use_case_cls(self.context).execute(*args) == return_value
 
-        assert self.mock_repository.create.call_count == 1
-        assert self.mock_repository.update.call_count == 1
-        assert self.mock_repository.delete.call_count == 1
+        assert self.repository.calls == [call for _, _, call, _ in steps]
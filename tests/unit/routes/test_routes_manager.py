@@ -0,0 +1,54 @@
+import pytest
+from fastapi import FastAPI
+
+from src.adapters.services.task.task_service import TaskService
+from src.adapters.web.controllers.task.task_controller import get_task_service
+from src.routes.routes_manager import RoutesManager
+
+
+class TestRoutesManager:
+    """Test cases for RoutesManager"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.app = FastAPI()
+        self.routes_manager = RoutesManager(self.app)
+
+    def test_include_routes_registers_task_routes(self):
+        """Test that task routes are added to the app"""
+        self.routes_manager.include_routes()
+
+        paths = {route.path for route in self.app.routes}
+        assert "/tasks/" in paths
+        assert "/tasks/{task_id}" in paths
+
+    async def test_dependency_override_returns_shared_service(self):
+        """Test that repeated includes resolve to the same task service"""
+        self.routes_manager.include_routes()
+        first = await self.app.dependency_overrides[get_task_service]()
+        self.routes_manager.include_routes()
+        second = await self.app.dependency_overrides[get_task_service]()
+
+        assert isinstance(first, TaskService)
+        assert first is second is self.routes_manager.task_service
+
+    def test_include_routes_accepts_async_endpoints(self):
+        """Test that an app with only async endpoints passes the startup check"""
+
+        @self.app.get("/a")
+        async def async_endpoint():
+            return {}
+
+        self.routes_manager.include_routes()
+
+        assert "/a" in {route.path for route in self.app.routes}
+
+    def test_include_routes_rejects_sync_endpoints(self):
+        """Test that a plain def endpoint fails the startup check"""
+
+        @self.app.get("/s")
+        def sync_endpoint():
+            return {}
+
+        with pytest.raises(RuntimeError, match="/s"):
+            self.routes_manager.include_routes()
@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from src.core.domain.model import Task
+from src.schemas.schemas import TaskOutput
+
+FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class TestTaskOutput:
+    """Test cases for TaskOutput"""
+
+    def test_from_task_with_timestamps(self):
+        """Test TaskOutput.from_task method with timestamps"""
+        task = Task(
+            id=1,
+            title="Test Task",
+            category="Testing",
+            created_at=FROZEN_NOW,
+            updated_at=FROZEN_NOW,
+        )
+
+        result = TaskOutput.from_task(task)
+
+        assert result.id == 1
+        assert result.title == "Test Task"
+        assert result.category == "Testing"
+        assert result.created_at == "2024-01-01T12:00:00"
+        assert result.updated_at == "2024-01-01T12:00:00"
+
+    def test_from_task_without_timestamps(self):
+        """Test TaskOutput.from_task method without timestamps"""
+        task = Task(id=1, title="Test Task", category="Testing")
+
+        result = TaskOutput.from_task(task)
+
+        assert result.created_at is None
+        assert result.updated_at is None
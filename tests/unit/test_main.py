@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from main import app
+from src.adapters.web import exception_handlers
+from src.adapters.web.controllers.task.task_controller import get_task_service
+
+_SERVICE_METHODS = (
+    "get_all_tasks",
+    "create_task",
+    "get_task_by_id",
+    "update_task",
+    "delete_task",
+)
+_TASK_JSON = {"title": "Task", "category": "Category"}
+
+
+@pytest.fixture
+async def failing_client(mock_service):
+    """Fixture that serves main.app with a task service that always raises"""
+    for method in _SERVICE_METHODS:
+        getattr(mock_service, method).side_effect = Exception("Service error")
+
+    async def provide_task_service():
+        return mock_service
+
+    original = app.dependency_overrides[get_task_service]
+    app.dependency_overrides[get_task_service] = provide_task_service
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+    finally:
+        app.dependency_overrides[get_task_service] = original
+
+
+class TestMainApp:
+    """Test cases for the application wiring in main.py"""
+
+    @pytest.mark.parametrize(
+        "verb, url, body",
+        [
+            ("GET", "/tasks/", None),
+            ("POST", "/tasks/", _TASK_JSON),
+            ("GET", "/tasks/1", None),
+            ("PUT", "/tasks/1", _TASK_JSON),
+            ("DELETE", "/tasks/1", None),
+        ],
+        ids=["get_all", "create", "get_by_id", "update", "delete"],
+    )
+    async def test_unexpected_error_returns_500_with_cors(
+        self, failing_client, verb, url, body
+    ):
+        """Test that an unexpected error is logged once and answered with CORS"""
+        with patch.object(exception_handlers, "logger") as mock_logger:
+            response = await failing_client.request(
+                verb, url, json=body, headers={"Origin": "http://example.com"}
+            )
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "Internal server error"}
+        assert response.headers["access-control-allow-origin"] == "*"
+        mock_logger.log_exception.assert_called_once()